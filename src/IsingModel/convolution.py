@@ -0,0 +1,129 @@
+import numpy as np
+from scipy import fft
+
+
+class FFTConvolver(object):
+    """
+    Applies a fixed 2D kernel to lattices of a fixed shape through the FFT.
+
+    The kernel spectrum is computed once at construction time and reused on every call, so each convolution costs
+    one forward and one inverse real FFT regardless of the kernel size. The output matches
+    ``scipy.signal.convolve2d(values, kernel, mode='same', boundary=boundary, fillvalue=fill)`` up to floating point
+    round-off.
+
+    Parameters:
+    -----------
+    kernel : numpy.ndarray
+        The 2D convolution kernel.
+    shape : tuple
+        The (height, width) of the lattices that will be convolved.
+    boundary : str, optional (default='fill')
+        Boundary condition. Can be 'wrap' (circular FFT), 'fill' (zero padded FFT plus a precomputed fill term) or
+        'symm' (circular FFT over the mirrored lattice).
+    fill : float, optional (default=0)
+        Value of the cells outside the lattice when boundary is 'fill'.
+    """
+
+    BOUNDARIES = ('wrap', 'fill', 'symm')
+
+    def __init__(self,
+                 kernel: np.ndarray,
+                 shape: tuple,
+                 boundary: str = 'fill',
+                 fill: float = 0):
+        if boundary not in self.BOUNDARIES:
+            raise ValueError('Unknown boundary \'%s\', expected one of %s' % (boundary, self.BOUNDARIES))
+
+        self.kernel = np.asarray(kernel, dtype=np.float64)
+        self.shape = tuple(shape)
+        self.boundary = boundary
+        self.fill = fill
+
+        height, width = self.shape
+        kernel_height, kernel_width = self.kernel.shape
+
+        # Offset of the 'same' output window inside the 'full' convolution
+        self._offset = ((kernel_height - 1) // 2, (kernel_width - 1) // 2)
+
+        if boundary == 'wrap':
+            self._fft_shape = (height, width)
+            self._spectrum = fft.rfft2(self._fold_kernel(self._fft_shape))
+        elif boundary == 'symm':
+            # The symmetric extension of the lattice is periodic with twice its size
+            self._fft_shape = (2 * height, 2 * width)
+            self._spectrum = fft.rfft2(self._fold_kernel(self._fft_shape))
+        else:
+            self._fft_shape = (fft.next_fast_len(height + kernel_height - 1, real=True),
+                               fft.next_fast_len(width + kernel_width - 1, real=True))
+            self._spectrum = fft.rfft2(self.kernel, s=self._fft_shape)
+
+            # Contribution of the constant cells outside the lattice, which does not depend on the lattice values
+            self._fill_term = None
+
+            if fill != 0:
+                self._fill_term = fill * (np.sum(self.kernel) - self._convolve_fill(np.ones(self.shape)))
+
+    def _fold_kernel(self, fft_shape: tuple):
+        """
+        Wraps the kernel around a periodic lattice of the given shape, centred on the origin.
+
+        Parameters:
+        -----------
+        fft_shape : tuple
+            The shape of the periodic lattice.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The folded kernel, which may be smaller than the lattice or wrap around it several times.
+        """
+        rows = (np.arange(self.kernel.shape[0]) - self._offset[0]) % fft_shape[0]
+        cols = (np.arange(self.kernel.shape[1]) - self._offset[1]) % fft_shape[1]
+
+        folded = np.zeros(fft_shape)
+        np.add.at(folded, (rows[:, None], cols[None, :]), self.kernel)
+
+        return folded
+
+    def _convolve_fill(self, values: np.ndarray):
+        """
+        Zero padded linear convolution cropped to the 'same' window.
+        """
+        height, width = self.shape
+        row, col = self._offset
+        full = fft.irfft2(fft.rfft2(values, s=self._fft_shape) * self._spectrum, s=self._fft_shape)
+
+        return full[..., row:row + height, col:col + width]
+
+    def __call__(self, values: np.ndarray):
+        """
+        Convolves the lattice with the kernel.
+
+        Parameters:
+        -----------
+        values : numpy.ndarray
+            The lattice, with shape equal to the one given at construction time.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The convolved lattice, with the same shape as the input.
+        """
+        if self.boundary == 'wrap':
+            return fft.irfft2(fft.rfft2(values) * self._spectrum, s=self._fft_shape)
+
+        if self.boundary == 'symm':
+            height, width = self.shape
+            mirrored = np.empty(values.shape[:-2] + self._fft_shape)
+            mirrored[..., :height, :width] = values
+            mirrored[..., :height, width:] = values[..., :, ::-1]
+            mirrored[..., height:, :] = mirrored[..., height - 1::-1, :]
+
+            return fft.irfft2(fft.rfft2(mirrored) * self._spectrum, s=self._fft_shape)[..., :height, :width]
+
+        result = self._convolve_fill(values)
+
+        if self._fill_term is not None:
+            result += self._fill_term
+
+        return result
@@ -4,12 +4,16 @@
 from __future__ import division
 
 import copy
+import warnings
 from typing import Callable, Any
 
 import numpy as np
 import simcx
 from scipy import signal
 
+import jit_kernels
+from convolution import FFTConvolver
+from lattice import neighbour_sum, checkerboard, acceptance_probability, acceptance_table
 from perturbations import perturb_circle
 from util.graphic_util import *
 from distribution_functions import *
@@ -31,7 +35,9 @@ class GameOfIce(simcx.Simulator):
     neighbourhood_size : int, optional (default=1)
         Size of the neighbourhood for each cell.
     method : str, optional (default='global')
-        Method used to update the grid. Can be 'global' or 'local'.
+        Method used to update the grid. Can be 'global' or 'local'. The 'local' method performs a red/black
+        checkerboard sweep of the nearest-neighbour Ising model, which requires an even width and height to keep
+        detailed balance across the periodic boundaries; odd lattices are rejected.
     initial_temperature : float, optional (default=1.0)
         Initial temperature of the simulation.
     n_temperature_decay_steps : int, optional (default=100)
@@ -46,6 +52,15 @@ class GameOfIce(simcx.Simulator):
         Boundary condition used in the convolution.
     fill : int, optional (default=0)
         Fill value used in the convolution.
+    convolution_method : str, optional (default='fft')
+        How the neighbourhood kernel is applied in the 'global' method. Can be 'fft', which precomputes the kernel
+        spectrum once and reuses it on every step, or 'direct', which uses scipy.signal.convolve2d.
+    acceptance : str, optional (default='heat_bath')
+        Acceptance rule of the 'local' method. Can be 'heat_bath' or 'metropolis'.
+    backend : str, optional (default='numpy')
+        Implementation of the lattice updates. Can be 'numpy' (vectorized) or 'jit', which runs Numba compiled
+        kernels that update the lattice in a single parallel pass without intermediate masks. Falls back to 'numpy' with a warning
+        when Numba is not installed.
 
     """
 
@@ -60,6 +75,9 @@ class GameOfIce(simcx.Simulator):
     DEFAULT_INITIAL_TEMPERATURE = 1.0
     DEFAULT_COUPLING_CONSTANT = 1.0
     DEFAULT_N_TEMPERATURE_DECAY_STEPS = 100
+    DEFAULT_CONVOLUTION_METHOD = 'fft'
+    DEFAULT_ACCEPTANCE = 'heat_bath'
+    DEFAULT_BACKEND = 'numpy'
     DEFAULT_PERTURBATION_FUNCTION = perturb_circle
 
     def __init__(self,
@@ -74,7 +92,10 @@ class GameOfIce(simcx.Simulator):
                  dist_func: str = DEFAULT_DIST_FUNC,
                  func_config: dict = None,
                  boundary: str = DEFAULT_BOUNDARY,
-                 fill: int = DEFAULT_FILL):
+                 fill: int = DEFAULT_FILL,
+                 convolution_method: str = DEFAULT_CONVOLUTION_METHOD,
+                 acceptance: str = DEFAULT_ACCEPTANCE,
+                 backend: str = DEFAULT_BACKEND):
         super(GameOfIce, self).__init__()
 
         # Set the simulation parameters
@@ -88,13 +109,17 @@ class GameOfIce(simcx.Simulator):
         self.temperature_decay_step = self.temperature / self.n_temperature_decay_steps
         self.coupling_constant = coupling_constant
         self.dist_func = dist_func
-        self.values = np.zeros((self.height, self.width))
+        self.shape = self._lattice_shape()
+        self.values = np.zeros(self.shape)
         self.boundary = boundary
         self.fill = fill
+        self.convolution_method = convolution_method
+        self.acceptance = acceptance
+        self.backend = backend
 
         self.step_counter = 0
-        self.sum_inf_neighbours = np.zeros((self.height, self.width))
-        self.initial_values = np.zeros((self.height, self.width))
+        self.sum_inf_neighbours = np.zeros(self.shape)
+        self.initial_values = np.zeros(self.shape)
 
         # Create grid and perform distribution function
         center_x, center_y = np.array((height, width)) // 2
@@ -134,6 +159,44 @@ class GameOfIce(simcx.Simulator):
         self.neighbourhood = neighbour_init
         self.dirty = False
 
+        self._convolver = None
+
+        if convolution_method == 'fft':
+            self._convolver = FFTConvolver(self.neighbourhood, (self.height, self.width), boundary, fill)
+        elif convolution_method != 'direct':
+            raise ValueError('Unknown convolution method \'%s\'' % convolution_method)
+
+        if backend == 'jit' and not jit_kernels.NUMBA_AVAILABLE:
+            warnings.warn('Numba is not installed, falling back to the numpy backend')
+            self.backend = 'numpy'
+        elif backend not in ('numpy', 'jit'):
+            raise ValueError('Unknown backend \'%s\'' % backend)
+
+        if method == 'local' and (width % 2 != 0 or height % 2 != 0):
+            # Otherwise the first and last rows or columns hold neighbours of the same colour, updated together
+            raise ValueError('The \'local\' method requires an even width and height')
+
+        # Checkerboard sub-lattices and buffers reused by every sweep of the 'local' method
+        self._colours = checkerboard(self.height, self.width)
+        self._field = None
+        self._alignment = np.empty(self.shape, dtype=np.intp)
+        self._alignment_offset = 4
+        self._probability = np.empty(self.shape)
+        self._flip = np.empty(self.shape, dtype=bool)
+        self._table = None
+        self._table_key = None
+
+    def _lattice_shape(self):
+        """
+        Shape of the arrays holding the state of the simulation.
+
+        Returns:
+        --------
+        tuple
+            The (height, width) of the lattice.
+        """
+        return self.height, self.width
+
     def local_field(self, i, j):
         """
         Calculate the local field for a given cell.
@@ -173,10 +236,28 @@ class GameOfIce(simcx.Simulator):
         float
             Probability of the cell switching its state.
         """
-        t = self.temperature
-        e = -self.local_field(i, j) * self.values[i, j]
+        delta_energy = 2 * self.local_field(i, j) * self.values[i, j]
+
+        return acceptance_probability(delta_energy, self.temperature, self.acceptance)
+
+    def acceptance_table(self):
+        """
+        Flip probabilities of the 'local' method, indexed by the alignment of a spin with its neighbours plus 4.
+
+        The table is only recomputed when the temperature, the coupling constant or the acceptance rule change.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The 9 flip probabilities.
+        """
+        key = (self.temperature, self.coupling_constant, self.acceptance)
 
-        return np.exp(-e / t) / (np.exp(-e / t) + np.exp(e / t))  # boltzmann distribution
+        if key != self._table_key:
+            self._table = acceptance_table(self.temperature, self.coupling_constant, self.acceptance)
+            self._table_key = key
+
+        return self._table
 
     def random(self, prob):
         """
@@ -213,29 +294,85 @@ class GameOfIce(simcx.Simulator):
 
         self.dirty = True
 
-    def step(self, delta=0):
+    def _convolve(self, values):
         """
-        Update the grid by applying the Game of Life rules.
+        Apply the neighbourhood kernel to a lattice with the configured boundary conditions.
+
+        Parameters:
+        -----------
+        values : numpy.ndarray
+            The lattice to convolve.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The summed influence of the neighbours of each cell.
+        """
+        if self._convolver is not None:
+            return self._convolver(values)
+
+        return signal.convolve2d(values, self.neighbourhood, mode='same', boundary=self.boundary, fillvalue=self.fill)
+
+    def _sweep_local(self):
+        """
+        Update the black and then the white sub-lattice, looking the flip probabilities up in the acceptance table.
+        """
+        table = self.acceptance_table()
+        uniform = np.random.random(self.shape)
+
+        if self._field is None or self._field.dtype != self.values.dtype:
+            self._field = np.empty_like(self.values)
+
+        for colour in self._colours:
+            neighbour_sum(self.values, out=self._field)
+            np.multiply(self._field, self.values, out=self._alignment, casting='unsafe')
+            self._alignment += self._alignment_offset
+            np.take(table, self._alignment, out=self._probability)
+            np.less(uniform, self._probability, out=self._flip)
+            self._flip &= colour
+            np.negative(self.values, out=self.values, where=self._flip)
+
+    def _decay_temperature(self):
+        """
+        Lower the temperature by one decay step, as long as it stays positive.
         """
         if self.temperature - self.temperature_decay_step > 0:
             self.temperature -= self.temperature_decay_step
 
-        if self.method == 'global':
-            self.sum_inf_neighbours = signal.convolve2d(self.values, self.neighbourhood,
-                                                        mode='same', boundary=self.boundary, fillvalue=self.fill)
+    def _update_global(self):
+        """
+        Turn each cell up or down with a probability given by the summed influence of its neighbourhood.
+        """
+        self.sum_inf_neighbours = self._convolve(self.values)
 
-        if self.method == 'global':
+        if self.backend == 'jit':
+            jit_kernels.update_global(self.values, self.sum_inf_neighbours, np.random.random(self.shape))
+        else:
             n = self.sum_inf_neighbours
             mask1 = np.random.random(size=n.shape) < n
             mask2 = -np.random.random(size=n.shape) > n
             self.values[mask1 & (n > 0)] = +1
             self.values[mask2] = -1
+
+    def _update_local(self):
+        """
+        Perform one checkerboard sweep of the nearest-neighbour model.
+        """
+        if self.backend == 'jit':
+            jit_kernels.sweep_local(self.values, self.acceptance_table(), np.random.random(self.shape))
+        else:
+            self._sweep_local()
+
+    def step(self, delta=0):
+        """
+        Update the grid by applying the Game of Life rules.
+        """
+        self._decay_temperature()
+
+        if self.method == 'global':
+            self._update_global()
         elif self.method == 'local':
-            inf = self.local_field(np.arange(self.height)[:, None], np.arange(self.width))
-            e = -inf * self.values
-            p = np.exp(-e / self.temperature) / (np.exp(-e / self.temperature) + np.exp(e / self.temperature))
-            mask = np.random.rand(*self.values.shape) < p
-            self.values[mask] = -self.values[mask]
+            self._update_local()
 
         self.dirty = True
         self.step_counter += 1
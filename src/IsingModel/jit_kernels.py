@@ -0,0 +1,76 @@
+"""
+Compiled sweep kernels used by GameOfIce when ``backend='jit'``.
+
+The kernels update the lattice in place in a single fused pass over the rows, in parallel, instead of building the
+full lattice masks and index arrays of the vectorized implementation. Numba is an optional dependency: when it is not installed ``NUMBA_AVAILABLE`` is
+False and the kernels are not defined.
+"""
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+NUMBA_AVAILABLE = numba is not None
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, parallel=True)
+    def sweep_local(values, table, uniform):
+        """
+        Checkerboard sweep of the nearest-neighbour model with periodic boundaries.
+
+        Parameters:
+        -----------
+        values : numpy.ndarray
+            The lattice, updated in place.
+        table : numpy.ndarray
+            Flip probabilities indexed by the alignment of a spin with its 4 neighbours plus 4.
+        uniform : numpy.ndarray
+            Uniform random numbers in [0, 1), one per cell.
+        """
+        height, width = values.shape
+
+        for colour in range(2):
+            # Cells of the same colour are never neighbours, so the rows can be updated in parallel
+            for i in numba.prange(height):
+                up = i - 1 if i > 0 else height - 1
+                down = i + 1 if i < height - 1 else 0
+
+                for j in range((i + colour) % 2, width, 2):
+                    left = j - 1 if j > 0 else width - 1
+                    right = j + 1 if j < width - 1 else 0
+                    field = values[up, j] + values[down, j] + values[i, left] + values[i, right]
+
+                    if uniform[i, j] < table[int(values[i, j] * field) + 4]:
+                        values[i, j] = -values[i, j]
+
+    @numba.njit(cache=True, parallel=True)
+    def update_global(values, field, uniform):
+        """
+        Threshold update of the 'global' method.
+
+        A positive field turns a cell up with probability equal to the field and a negative field turns it down with
+        probability equal to its magnitude. Only one of the two can happen to a cell, so a single random number per
+        cell is enough.
+
+        Parameters:
+        -----------
+        values : numpy.ndarray
+            The lattice, updated in place.
+        field : numpy.ndarray
+            The summed influence of the neighbours of each cell.
+        uniform : numpy.ndarray
+            Uniform random numbers in [0, 1), one per cell.
+        """
+        height, width = values.shape
+
+        for i in numba.prange(height):
+            for j in range(width):
+                n = field[i, j]
+                u = uniform[i, j]
+
+                if u < n and n > 0:
+                    values[i, j] = 1
+                elif -u > n:
+                    values[i, j] = -1
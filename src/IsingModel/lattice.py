@@ -0,0 +1,112 @@
+import numpy as np
+from scipy.special import expit
+
+# Values taken by the product between a spin and the sum of its 4 nearest neighbours, used to index the tables
+LOCAL_ALIGNMENTS = np.arange(-4, 5)
+
+
+def neighbour_sum(values: np.ndarray, out: np.ndarray = None):
+    """
+    Sums the 4 nearest neighbours of every cell of a lattice with periodic boundaries.
+
+    Parameters:
+    -----------
+    values : numpy.ndarray
+        The lattice. Any leading dimensions are treated as a batch of independent lattices.
+    out : numpy.ndarray, optional
+        Preallocated output array with the same shape as the lattice.
+
+    Returns:
+    --------
+    numpy.ndarray
+        The sum of the neighbours of each cell.
+    """
+    if out is None:
+        out = np.empty_like(values)
+
+    out[..., 1:, :] = values[..., :-1, :]
+    out[..., 0, :] = values[..., -1, :]
+    out[..., :-1, :] += values[..., 1:, :]
+    out[..., -1, :] += values[..., 0, :]
+    out[..., :, 1:] += values[..., :, :-1]
+    out[..., :, 0] += values[..., :, -1]
+    out[..., :, :-1] += values[..., :, 1:]
+    out[..., :, -1] += values[..., :, 0]
+
+    return out
+
+
+def checkerboard(height: int, width: int):
+    """
+    Splits a lattice into its two checkerboard sub-lattices.
+
+    No two cells of the same sub-lattice are nearest neighbours as long as both dimensions are even, so all the cells
+    of one colour can be updated at once without breaking detailed balance.
+
+    Parameters:
+    -----------
+    height : int
+        Height of the lattice.
+    width : int
+        Width of the lattice.
+
+    Returns:
+    --------
+    tuple
+        The boolean masks of the black and white cells.
+    """
+    black = (np.arange(height)[:, None] + np.arange(width)) % 2 == 0
+
+    return black, ~black
+
+
+def acceptance_probability(delta_energy, temperature, acceptance: str = 'heat_bath'):
+    """
+    Probability of accepting a spin flip that changes the energy by a given amount.
+
+    Parameters:
+    -----------
+    delta_energy : float or numpy.ndarray
+        Energy change caused by the flip.
+    temperature : float or numpy.ndarray
+        Temperature of the system.
+    acceptance : str, optional (default='heat_bath')
+        Acceptance rule. Can be 'heat_bath' (Glauber) or 'metropolis'.
+
+    Returns:
+    --------
+    float or numpy.ndarray
+        The flip probability.
+    """
+    if acceptance == 'heat_bath':
+        return expit(-np.divide(delta_energy, temperature))
+    elif acceptance == 'metropolis':
+        return np.exp(-np.divide(np.maximum(delta_energy, 0), temperature))
+
+    raise ValueError('Unknown acceptance rule \'%s\'' % acceptance)
+
+
+def acceptance_table(temperature, coupling_constant, acceptance: str = 'heat_bath'):
+    """
+    Tabulates the flip probability for every value of the local alignment of a spin with its 4 nearest neighbours.
+
+    Entry ``k`` holds the probability of flipping a spin whose product with the sum of its neighbours is ``k - 4``.
+
+    Parameters:
+    -----------
+    temperature : float or numpy.ndarray
+        Temperature of the system. An array of temperatures yields one table per temperature along the last axis.
+    coupling_constant : float or numpy.ndarray
+        Coupling constant between nearest neighbours.
+    acceptance : str, optional (default='heat_bath')
+        Acceptance rule. Can be 'heat_bath' or 'metropolis'.
+
+    Returns:
+    --------
+    numpy.ndarray
+        The flip probabilities, with 9 entries along the last axis.
+    """
+    temperature = np.asarray(temperature, dtype=np.float64)[..., None]
+    coupling_constant = np.asarray(coupling_constant, dtype=np.float64)[..., None]
+
+    return acceptance_probability(2 * coupling_constant * LOCAL_ALIGNMENTS, temperature, acceptance)
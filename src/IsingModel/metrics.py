@@ -2,14 +2,14 @@ import numpy as np
 
 
 def magnetization(states: np.ndarray):
-    return np.mean(states)
+    return np.mean(states, axis=(-2, -1))
 
 
 def energy(states: np.ndarray):
-    nb_sum = np.roll(states, 1, axis=0) + np.roll(states, -1, axis=0) + np.roll(states, 1, axis=1) + np.roll(states, -1,
-                                                                                                          axis=1)
-    return np.sum(states * nb_sum)
+    nb_sum = np.roll(states, 1, axis=-2) + np.roll(states, -1, axis=-2) + np.roll(states, 1, axis=-1) + np.roll(states, -1,
+                                                                                                            axis=-1)
+    return np.sum(states * nb_sum, axis=(-2, -1))
 
 
 def correlation(states: np.ndarray):
-    return np.mean(states * np.roll(states, 1, axis=0))
+    return np.mean(states * np.roll(states, 1, axis=-2), axis=(-2, -1))
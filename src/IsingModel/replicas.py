@@ -0,0 +1,190 @@
+import numpy as np
+from scipy import signal
+
+import jit_kernels
+from game_of_ice import GameOfIce
+from lattice import acceptance_table
+from metrics import magnetization, energy, correlation
+
+
+class ReplicaGameOfIce(GameOfIce):
+    """
+    A batch of independent Game of Ice lattices that are advanced together.
+
+    The state is held in a single ``(n_replicas, height, width)`` array, so each step applies one vectorized
+    convolution or checkerboard sweep to every replica at once. The temperature, coupling constant and the
+    probability given to ``random`` may be scalars or vectors with one entry per replica. All other parameters are
+    shared and have the same meaning as in GameOfIce.
+
+    Parameters:
+    -----------
+    n_replicas : int
+        Number of independent lattices.
+    **kwargs : dict
+        Parameters of GameOfIce. ``initial_temperature`` and ``coupling_constant`` are broadcast to one value per
+        replica.
+    """
+
+    def __init__(self, n_replicas: int, **kwargs):
+        self.n_replicas = n_replicas
+
+        for name, default in (('initial_temperature', GameOfIce.DEFAULT_INITIAL_TEMPERATURE),
+                              ('coupling_constant', GameOfIce.DEFAULT_COUPLING_CONSTANT)):
+            value = np.asarray(kwargs.get(name, default), dtype=np.float64)
+            kwargs[name] = np.broadcast_to(value, (n_replicas,)).copy()
+
+        super(ReplicaGameOfIce, self).__init__(**kwargs)
+
+        # Offset of the table of each replica inside the flattened acceptance tables
+        self._alignment_offset = 4 + 9 * np.arange(n_replicas)[:, None, None]
+
+    def _lattice_shape(self):
+        """
+        Shape of the arrays holding the state of the simulation.
+
+        Returns:
+        --------
+        tuple
+            The (n_replicas, height, width) of the batch.
+        """
+        return self.n_replicas, self.height, self.width
+
+    def random(self, prob):
+        """
+        Initialize every replica with random values based on a given probability.
+
+        Parameters:
+        -----------
+        prob : float or numpy.ndarray
+            Probability of a cell being alive, either shared or one per replica.
+        """
+        prob = np.broadcast_to(np.asarray(prob, dtype=np.float64), (self.n_replicas,))
+        self.values = np.where(np.random.random(self.shape) < prob[:, None, None], +1, -1)
+        self.initial_values = self.values.copy()
+        self.dirty = True
+
+    def add_block(self, block, pos_x, pos_y):
+        """
+        Add a block of cells to every replica at a given position.
+
+        Parameters:
+        -----------
+        block : numpy.ndarray
+            Block of cells to add to the grid.
+        pos_x : int
+            X-coordinate of the position to add the block.
+        pos_y : int
+            Y-coordinate of the position to add the block.
+        """
+        height, width = block.shape
+        self.values[:, pos_y:pos_y + height, pos_x:pos_x + width] = block
+        self.dirty = True
+
+    def acceptance_table(self):
+        """
+        Flip probabilities of the 'local' method for every replica.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The 9 flip probabilities of each replica, flattened into a single array of ``9 * n_replicas`` entries.
+        """
+        key = (self.temperature.tobytes(), self.coupling_constant.tobytes(), self.acceptance)
+
+        if key != self._table_key:
+            self._table = acceptance_table(self.temperature, self.coupling_constant, self.acceptance).ravel()
+            self._table_key = key
+
+        return self._table
+
+    def _decay_temperature(self):
+        """
+        Lower the temperature of each replica by its decay step, as long as it stays positive.
+        """
+        decayed = self.temperature - self.temperature_decay_step
+        self.temperature = np.where(decayed > 0, decayed, self.temperature)
+
+    def _convolve(self, values):
+        """
+        Apply the neighbourhood kernel to every replica.
+
+        Parameters:
+        -----------
+        values : numpy.ndarray
+            The batch of lattices to convolve.
+
+        Returns:
+        --------
+        numpy.ndarray
+            The summed influence of the neighbours of each cell of each replica.
+        """
+        if self._convolver is not None:
+            return self._convolver(values)
+
+        return np.stack([signal.convolve2d(replica, self.neighbourhood, mode='same', boundary=self.boundary,
+                                           fillvalue=self.fill) for replica in values])
+
+    def _update_global(self):
+        """
+        Threshold update of every replica.
+        """
+        if self.backend != 'jit':
+            super(ReplicaGameOfIce, self)._update_global()
+            return
+
+        self.sum_inf_neighbours = self._convolve(self.values)
+        uniform = np.random.random(self.shape)
+
+        for r in range(self.n_replicas):
+            jit_kernels.update_global(self.values[r], self.sum_inf_neighbours[r], uniform[r])
+
+    def _update_local(self):
+        """
+        Checkerboard sweep of every replica.
+        """
+        if self.backend != 'jit':
+            self._sweep_local()
+            return
+
+        table = self.acceptance_table().reshape(self.n_replicas, 9)
+        uniform = np.random.random(self.shape)
+
+        for r in range(self.n_replicas):
+            jit_kernels.sweep_local(self.values[r], table[r], uniform[r])
+
+    def perturbate(self,
+                   x: int,
+                   y: int,
+                   radius: int,
+                   value: int):
+        """
+        Puts a block at the specified coordinates of every replica.
+
+        Parameters:
+        -----------
+        x : int
+            The x coordinate of the center of the perturbation.
+        y : int
+            The y coordinate of the center of the perturbation.
+        radius : int
+            The radius of the perturbation.
+        value : int
+            The value to set for the cells in the perturbation.
+        """
+        for replica in self.values:
+            self.perturbation_function(replica, x, y, radius, value)
+
+    def observables(self):
+        """
+        Magnetization, energy and nearest-neighbour correlation of each replica.
+
+        Returns:
+        --------
+        dict
+            One array with an entry per replica for each observable.
+        """
+        return {
+            'magnetization': magnetization(self.values),
+            'energy': energy(self.values),
+            'correlation': correlation(self.values),
+        }
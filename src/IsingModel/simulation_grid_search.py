@@ -5,6 +5,7 @@ import simcx
 
 from game_of_ice import GameOfIce
 from perturbations import perturb_circle
+from sweep import LOG_FILE_HEADER, run_code, format_row
 from util.grid_2d import Grid2D
 from util.stats_plot import StatsPlot
 from util.custom_display import CustomDisplay
@@ -23,8 +24,6 @@ def main():
     GRID_HEIGHT_CELLS = 100
     curr_time = perf_counter()
     LOG_FILE_PATH = str(curr_time) + 'output.log'
-    LOG_FILE_HEADER = 'code,neighbourhood,prob_generation,method,coupling_constant,initial_temperature,dist_function,' \
-                      'boundary,fill,phase_sensitivity,std,magnetization,correlation,energy,time,observations\n '
 
     # Set the size of the cells in the visualization
     CELL_SIZE = 3
@@ -55,29 +54,16 @@ def main():
                             for dist_function in DIST_FUNCTION:
                                 for boundary in BOUNDARY:
                                     for fill in FILL:
-                                        data_row = '%d,%.2f,%s,' % (neighbourhood_size,
-                                                                   prob_generation,
-                                                                   method)
-
-                                        run_code = 'Neigh%dProb%.2fMethod%s' % (neighbourhood_size,
-                                                                                       prob_generation,
-                                                                                       method)
-                                        if method == 'local':
-                                            data_row += '%.1f,%.1f,' % (coupling_constant,
-                                                                       initial_temperature)
-                                            run_code += 'Coup%.1fTemp%.1f' % (coupling_constant,
-                                                                                     initial_temperature)
-                                        else:
-                                            data_row += 'NaN,NaN,'
-
-                                        run_code += 'Dist%sBound%s' % (dist_function, boundary)
-                                        data_row += '%s,%s,' % (dist_function, boundary)
-
-                                        if boundary == 'fill':
-                                            run_code += 'Fill%d' % fill
-                                            data_row += '%d,' % fill
-                                        else:
-                                            data_row += 'NaN,'
+                                        params = {
+                                            'neighbourhood': neighbourhood_size,
+                                            'prob_generation': prob_generation,
+                                            'method': method,
+                                            'coupling_constant': coupling_constant,
+                                            'initial_temperature': initial_temperature,
+                                            'dist_function': dist_function,
+                                            'boundary': boundary,
+                                            'fill': fill
+                                        }
 
                                         goi = GameOfIce(width=GRID_WIDTH_CELLS,
                                                         height=GRID_HEIGHT_CELLS,
@@ -104,7 +90,7 @@ def main():
                                         # Create a CustomDisplay instance to display the simulation
                                         display = CustomDisplay(goi,
                                                                 vis,
-                                                                run_code,
+                                                                run_code(params),
                                                                 x_min=0,
                                                                 x_max=CELL_SIZE * GRID_WIDTH_CELLS,
                                                                 y_min=GRID_STATS_PLOT_HEIGHT,
@@ -119,19 +105,18 @@ def main():
                                         # Run the simulation using the simcx library
                                         simcx.run()
 
-                                        if method == 'global':
-                                            data_row += '%.5f,%.5f,' % (stats_plot.phase_sensitivity, stats_plot.std)
-                                        else:
-                                            data_row += 'NaN,NaN,'
-                                        data_row += '%.5f,%.5f,%.5f,%d,' % (stats_plot.magnetization_,
-                                                                                stats_plot.corr,
-                                                                                stats_plot.e,
-                                                                                goi.step_counter)
+                                        results = {
+                                            'phase_sensitivity': stats_plot.phase_sensitivity,
+                                            'std': stats_plot.std,
+                                            'magnetization': stats_plot.magnetization_,
+                                            'correlation': stats_plot.corr,
+                                            'energy': stats_plot.e,
+                                            'time': goi.step_counter
+                                        }
                                         observations = input('Observations: ')
                                         if len(observations) == 0:
                                             observations = 'None'
-                                        data_row += observations
-                                        data_row = run_code + ',' + data_row + '\n'
+                                        data_row = format_row(params, results, observations)
                                         f.write(data_row)
                                         f.flush()
 
@@ -0,0 +1,320 @@
+"""
+Headless parameter sweep over GameOfIce configurations.
+
+Every combination of the parameter axes is simulated without a display for a fixed number of steps, or until the
+observables stop drifting, and the configurations are spread over a pool of worker processes. The results are
+written in the same CSV format as simulation_grid_search.
+
+Usage:
+------
+    python sweep.py --config sweep.json --output results.log
+    python sweep.py --method global local --initial-temperature 10 100 --steps 1000
+"""
+import argparse
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+
+import numpy as np
+import pyglet
+
+# Skip the hidden window pyglet creates on import, so that sweeps also run on machines without a display
+pyglet.options['shadow_window'] = False
+
+from game_of_ice import GameOfIce
+from metrics import magnetization, energy, correlation
+
+LOG_FILE_HEADER = 'code,neighbourhood,prob_generation,method,coupling_constant,initial_temperature,dist_function,' \
+                  'boundary,fill,phase_sensitivity,std,magnetization,correlation,energy,time,observations\n '
+
+# Parameter axes, in the order in which they are nested
+AXES = ('neighbourhood', 'prob_generation', 'method', 'coupling_constant', 'initial_temperature', 'dist_function',
+        'boundary', 'fill')
+
+DEFAULT_CONFIG = {
+    'width': 100,
+    'height': 100,
+    'neighbourhood': [100],
+    'prob_generation': [0.50],
+    'method': ['global'],
+    'coupling_constant': [1],
+    'initial_temperature': [100],
+    'dist_function': ['exp_decay'],
+    'boundary': ['fill'],
+    'fill': [1],
+    'func_config': {'decay_rate': -3},
+    'n_temperature_decay_steps': GameOfIce.DEFAULT_N_TEMPERATURE_DECAY_STEPS,
+    'n_steps': 1000,
+    'convergence': None,
+}
+
+
+def load_config(path: str = None, overrides: dict = None):
+    """
+    Builds a sweep configuration from the defaults, an optional JSON file and optional overrides.
+
+    Parameters:
+    -----------
+    path : str, optional
+        Path of a JSON file with any of the keys of DEFAULT_CONFIG.
+    overrides : dict, optional
+        Values that take precedence over the file. Keys with a None value are ignored.
+
+    Returns:
+    --------
+    dict
+        The sweep configuration.
+    """
+    config = dict(DEFAULT_CONFIG)
+
+    if path is not None:
+        with open(path) as f:
+            config.update(json.load(f))
+
+    if overrides is not None:
+        config.update({key: value for key, value in overrides.items() if value is not None})
+
+    return config
+
+
+def expand(config: dict):
+    """
+    Lists every configuration of a sweep.
+
+    Parameters:
+    -----------
+    config : dict
+        The sweep configuration, with a list of values for each parameter axis.
+
+    Returns:
+    --------
+    list
+        One dictionary per configuration, holding a single value for each axis plus the shared settings.
+    """
+    shared = {key: value for key, value in config.items() if key not in AXES}
+
+    return [dict(shared, **dict(zip(AXES, values))) for values in itertools.product(*(config[axis] for axis in AXES))]
+
+
+def run_code(params: dict):
+    """
+    Builds the code that identifies a configuration in the logs and screenshots.
+
+    Parameters:
+    -----------
+    params : dict
+        The configuration.
+
+    Returns:
+    --------
+    str
+        The run code.
+    """
+    code = 'Neigh%dProb%.2fMethod%s' % (params['neighbourhood'], params['prob_generation'], params['method'])
+
+    if params['method'] == 'local':
+        code += 'Coup%.1fTemp%.1f' % (params['coupling_constant'], params['initial_temperature'])
+
+    code += 'Dist%sBound%s' % (params['dist_function'], params['boundary'])
+
+    if params['boundary'] == 'fill':
+        code += 'Fill%d' % params['fill']
+
+    return code
+
+
+def format_row(params: dict, results: dict, observations: str = 'None'):
+    """
+    Formats the log line of a configuration.
+
+    Parameters:
+    -----------
+    params : dict
+        The configuration.
+    results : dict
+        The final values of the observables, as returned by run_configuration.
+    observations : str, optional
+        Free text written in the last column.
+
+    Returns:
+    --------
+    str
+        The log line, terminated by a new line.
+    """
+    row = '%d,%.2f,%s,' % (params['neighbourhood'], params['prob_generation'], params['method'])
+
+    if params['method'] == 'local':
+        row += '%.1f,%.1f,' % (params['coupling_constant'], params['initial_temperature'])
+    else:
+        row += 'NaN,NaN,'
+
+    row += '%s,%s,' % (params['dist_function'], params['boundary'])
+
+    if params['boundary'] == 'fill':
+        row += '%d,' % params['fill']
+    else:
+        row += 'NaN,'
+
+    if params['method'] == 'global':
+        row += '%.5f,%.5f,' % (results['phase_sensitivity'], results['std'])
+    else:
+        row += 'NaN,NaN,'
+
+    row += '%.5f,%.5f,%.5f,%d,' % (results['magnetization'], results['correlation'], results['energy'],
+                                   results['time'])
+
+    return run_code(params) + ',' + row + observations + '\n'
+
+
+def create_simulator(params: dict):
+    """
+    Builds and randomly initialises the simulator of a configuration.
+
+    Parameters:
+    -----------
+    params : dict
+        The configuration.
+
+    Returns:
+    --------
+    GameOfIce
+        The simulator.
+    """
+    goi = GameOfIce(width=params['width'],
+                    height=params['height'],
+                    neighbourhood_size=params['neighbourhood'],
+                    coupling_constant=params['coupling_constant'],
+                    method=params['method'],
+                    initial_temperature=params['initial_temperature'],
+                    n_temperature_decay_steps=params['n_temperature_decay_steps'],
+                    dist_func=params['dist_function'],
+                    boundary=params['boundary'],
+                    func_config=params['func_config'],
+                    fill=params['fill'])
+    goi.random(params['prob_generation'])
+
+    return goi
+
+
+def has_converged(history: list, window: int, tolerance: float):
+    """
+    Checks whether the mean of the observables moved less than a tolerance between the last two windows of steps.
+
+    Parameters:
+    -----------
+    history : list
+        The per-step values of the observables, as tuples.
+    window : int
+        Number of steps in each window.
+    tolerance : float
+        Largest accepted change of the windowed means.
+
+    Returns:
+    --------
+    bool
+        True if the observables are no longer drifting.
+    """
+    if len(history) < 2 * window:
+        return False
+
+    recent = np.array(history[-2 * window:])
+    drift = np.abs(np.mean(recent[window:], axis=0) - np.mean(recent[:window], axis=0))
+
+    return bool(np.all(drift < tolerance))
+
+
+def run_configuration(params: dict):
+    """
+    Simulates a configuration without a display.
+
+    The simulation runs for ``n_steps`` steps, unless ``convergence`` holds a dictionary with a ``window``, a
+    ``tolerance`` and a ``max_steps``, in which case it stops as soon as the per-site magnetization and energy drift
+    less than the tolerance between two consecutive windows.
+
+    Parameters:
+    -----------
+    params : dict
+        The configuration.
+
+    Returns:
+    --------
+    dict
+        The final values of the observables and the number of steps simulated.
+    """
+    goi = create_simulator(params)
+    convergence = params['convergence']
+
+    if convergence is None:
+        for _ in range(params['n_steps']):
+            goi.step()
+    else:
+        history = []
+        n_cells = goi.width * goi.height
+
+        while goi.step_counter < convergence['max_steps']:
+            goi.step()
+            history.append((magnetization(goi.values), energy(goi.values) / n_cells))
+
+            if goi.step_counter % convergence['window'] == 0 and \
+                    has_converged(history, convergence['window'], convergence['tolerance']):
+                break
+
+    return {
+        'phase_sensitivity': np.mean(goi.sum_inf_neighbours),
+        'std': np.std(goi.values),
+        'magnetization': magnetization(goi.values),
+        'correlation': correlation(goi.values),
+        'energy': energy(goi.values),
+        'time': goi.step_counter,
+    }
+
+
+def run_sweep(config: dict, output: str, n_workers: int = None):
+    """
+    Simulates every configuration of a sweep on a pool of processes and logs the results as they arrive.
+
+    Parameters:
+    -----------
+    config : dict
+        The sweep configuration.
+    output : str
+        Path of the CSV log.
+    n_workers : int, optional
+        Number of worker processes. Defaults to the number of cores.
+    """
+    configurations = expand(config)
+
+    with open(output, 'w') as f, ProcessPoolExecutor(max_workers=n_workers or os.cpu_count()) as executor:
+        f.write(LOG_FILE_HEADER)
+
+        for params, results in zip(configurations, executor.map(run_configuration, configurations)):
+            f.write(format_row(params, results))
+            f.flush()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Headless parameter sweep of the Game of Ice.')
+    parser.add_argument('--config', help='JSON file with the sweep configuration')
+    parser.add_argument('--output', default=str(perf_counter()) + 'output.log', help='path of the CSV log')
+    parser.add_argument('--workers', type=int, help='number of worker processes (default: number of cores)')
+    parser.add_argument('--width', type=int)
+    parser.add_argument('--height', type=int)
+    parser.add_argument('--steps', dest='n_steps', type=int, help='number of steps of each configuration')
+    parser.add_argument('--neighbourhood', nargs='+', type=int)
+    parser.add_argument('--prob-generation', nargs='+', type=float)
+    parser.add_argument('--method', nargs='+')
+    parser.add_argument('--coupling-constant', nargs='+', type=float)
+    parser.add_argument('--initial-temperature', nargs='+', type=float)
+    parser.add_argument('--dist-function', nargs='+')
+    parser.add_argument('--boundary', nargs='+')
+    parser.add_argument('--fill', nargs='+', type=int)
+    args = parser.parse_args()
+
+    overrides = {key: value for key, value in vars(args).items() if key not in ('config', 'output', 'workers')}
+    run_sweep(load_config(args.config, overrides), args.output, args.workers)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,10 @@
+import os
+import sys
+
+import pyglet
+
+# Skip the hidden window pyglet creates on import, so that the tests also run on machines without a display
+pyglet.options['shadow_window'] = False
+
+# The modules of the simulation are imported from the directory above the tests, as the scripts do
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from scipy import signal
+
+from convolution import FFTConvolver
+from game_of_ice import GameOfIce
+
+
+@pytest.mark.parametrize('boundary, fill', [('wrap', 0), ('fill', 0), ('fill', 1), ('symm', 0)])
+@pytest.mark.parametrize('kernel_shape', [(3, 3), (4, 6), (25, 31)])
+def test_fft_matches_convolve2d(boundary, fill, kernel_shape):
+    rng = np.random.default_rng(0)
+    kernel = rng.random(kernel_shape)
+    values = rng.choice((-1.0, 1.0), (12, 17))
+
+    expected = signal.convolve2d(values, kernel, mode='same', boundary=boundary, fillvalue=fill)
+
+    assert FFTConvolver(kernel, values.shape, boundary, fill)(values) == pytest.approx(expected, abs=1e-9)
+
+
+def test_fft_convolves_a_batch_of_lattices():
+    rng = np.random.default_rng(0)
+    kernel = rng.random((5, 5))
+    values = rng.choice((-1.0, 1.0), (3, 10, 8))
+    convolver = FFTConvolver(kernel, (10, 8), 'wrap')
+
+    for lattice, convolved in zip(values, convolver(values)):
+        expected = signal.convolve2d(lattice, kernel, mode='same', boundary='wrap')
+        assert convolved == pytest.approx(expected, abs=1e-9)
+
+
+def test_fft_rejects_unknown_boundary():
+    with pytest.raises(ValueError):
+        FFTConvolver(np.ones((3, 3)), (8, 8), 'reflect')
+
+
+@pytest.mark.parametrize('boundary', ['wrap', 'fill', 'symm'])
+def test_global_field_matches_direct_convolution(boundary):
+    fft_goi = GameOfIce(width=20, height=16, neighbourhood_size=3, boundary=boundary, convolution_method='fft')
+    direct_goi = GameOfIce(width=20, height=16, neighbourhood_size=3, boundary=boundary, convolution_method='direct')
+    fft_goi.random(0.5)
+
+    assert fft_goi._convolve(fft_goi.values) == pytest.approx(direct_goi._convolve(fft_goi.values), abs=1e-9)
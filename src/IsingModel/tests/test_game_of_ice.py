@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from scipy.special import ellipk
+
+from game_of_ice import GameOfIce
+from metrics import energy
+
+
+def onsager_energy(temperature):
+    """
+    Exact energy per site of the infinite square lattice with a unit coupling constant.
+    """
+    k = 2 / temperature
+    modulus = 2 * np.sinh(k) / np.cosh(k) ** 2
+
+    return -(1 + 2 / np.pi * (2 * np.tanh(k) ** 2 - 1) * ellipk(modulus ** 2)) / np.tanh(k)
+
+
+def mean_energy(goi, n_steps, n_discard):
+    goi.values = np.ones((goi.height, goi.width))
+    goi.temperature_decay_step = 0
+    energies = []
+
+    for step in range(n_steps):
+        goi.step()
+
+        if step >= n_discard:
+            # metrics.energy counts every bond twice
+            energies.append(-energy(goi.values) / (2 * goi.width * goi.height))
+
+    return np.mean(energies)
+
+
+@pytest.mark.parametrize('acceptance', ['heat_bath', 'metropolis'])
+@pytest.mark.parametrize('temperature', [1.8, 3.0])
+def test_local_matches_exact_energy(acceptance, temperature):
+    goi = GameOfIce(width=32, height=32, method='local', initial_temperature=temperature, acceptance=acceptance)
+
+    assert mean_energy(goi, 1200, 200) == pytest.approx(onsager_energy(temperature), abs=0.02)
+
+
+@pytest.mark.parametrize('width, height', [(17, 16), (16, 15), (17, 15)])
+def test_local_rejects_odd_lattice(width, height):
+    with pytest.raises(ValueError):
+        GameOfIce(width=width, height=height, method='local')
+
+
+def test_global_accepts_odd_lattice():
+    GameOfIce(width=17, height=15, method='global').step()
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+import jit_kernels
+from lattice import neighbour_sum, checkerboard, acceptance_table
+
+pytestmark = pytest.mark.skipif(not jit_kernels.NUMBA_AVAILABLE, reason='Numba is not installed')
+
+
+def reference_sweep_local(values, table, uniform):
+    for colour in checkerboard(*values.shape):
+        alignment = (values * neighbour_sum(values)).astype(int) + 4
+        values[colour & (uniform < table[alignment])] *= -1
+
+
+@pytest.mark.parametrize('temperature', [0.5, 2.3, 10.0])
+def test_sweep_local_matches_reference(temperature):
+    rng = np.random.default_rng(0)
+    values = rng.choice((-1.0, 1.0), (16, 24))
+    uniform = rng.random(values.shape)
+    table = acceptance_table(temperature, 1.0)
+    expected = values.copy()
+
+    jit_kernels.sweep_local(values, table, uniform)
+    reference_sweep_local(expected, table, uniform)
+
+    assert np.array_equal(values, expected)
+
+
+def test_update_global_matches_reference():
+    rng = np.random.default_rng(0)
+    values = rng.choice((-1.0, 1.0), (16, 24))
+    field = rng.uniform(-1.5, 1.5, values.shape)
+    uniform = rng.random(values.shape)
+    expected = values.copy()
+    expected[(uniform < field) & (field > 0)] = 1
+    expected[-uniform > field] = -1
+
+    jit_kernels.update_global(values, field, uniform)
+
+    assert np.array_equal(values, expected)
+
@@ -0,0 +1,34 @@
+import numpy as np
+import pytest
+
+from lattice import neighbour_sum, checkerboard, acceptance_probability, acceptance_table, LOCAL_ALIGNMENTS
+
+
+def test_neighbour_sum_is_periodic():
+    values = np.random.default_rng(0).choice((-1, 1), (6, 8))
+    expected = (np.roll(values, 1, axis=0) + np.roll(values, -1, axis=0) + np.roll(values, 1, axis=1) +
+                np.roll(values, -1, axis=1))
+
+    assert np.array_equal(neighbour_sum(values), expected)
+
+
+def test_checkerboard_colours_have_no_common_neighbours():
+    black, white = checkerboard(6, 8)
+
+    assert np.array_equal(black, ~white)
+    assert not np.any(neighbour_sum(black.astype(int)) * black)
+
+
+@pytest.mark.parametrize('acceptance', ['heat_bath', 'metropolis'])
+def test_acceptance_table_satisfies_detailed_balance(acceptance):
+    temperature, coupling_constant = 1.7, 0.8
+    table = acceptance_table(temperature, coupling_constant, acceptance)
+    delta_energy = 2 * coupling_constant * LOCAL_ALIGNMENTS
+
+    assert table == pytest.approx(acceptance_probability(delta_energy, temperature, acceptance))
+    assert table / table[::-1] == pytest.approx(np.exp(-delta_energy / temperature))
+
+
+def test_acceptance_rejects_unknown_rule():
+    with pytest.raises(ValueError):
+        acceptance_probability(1.0, 1.0, 'glauber')
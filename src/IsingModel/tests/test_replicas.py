@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from scipy import signal
+
+from lattice import acceptance_table
+from metrics import energy
+from replicas import ReplicaGameOfIce
+
+# Exact energies per site of the infinite square lattice with a unit coupling constant, from Onsager's solution
+EXACT_ENERGIES = {1.8: -1.8593, 3.0: -0.8173}
+
+
+def test_replicas_sweep_at_their_own_temperature():
+    temperatures = np.array(list(EXACT_ENERGIES))
+    goi = ReplicaGameOfIce(n_replicas=2, width=32, height=32, method='local', initial_temperature=temperatures)
+    goi.values = np.ones(goi.shape)
+    goi.temperature_decay_step = 0
+    energies = []
+
+    for step in range(1200):
+        goi.step()
+
+        if step >= 200:
+            energies.append(-energy(goi.values) / (2 * goi.width * goi.height))
+
+    assert np.mean(energies, axis=0) == pytest.approx(list(EXACT_ENERGIES.values()), abs=0.02)
+
+
+def test_replicas_have_one_acceptance_table_each():
+    goi = ReplicaGameOfIce(n_replicas=3, method='local', initial_temperature=[1.0, 2.0, 3.0], coupling_constant=0.5)
+    tables = goi.acceptance_table().reshape(3, 9)
+
+    for table, temperature in zip(tables, [1.0, 2.0, 3.0]):
+        assert table == pytest.approx(acceptance_table(temperature, 0.5))
+
+
+@pytest.mark.parametrize('convolution_method', ['fft', 'direct'])
+def test_replicas_convolve_each_lattice(convolution_method):
+    goi = ReplicaGameOfIce(n_replicas=3, width=20, height=16, neighbourhood_size=3, boundary='wrap',
+                           convolution_method=convolution_method)
+    goi.random([0.2, 0.5, 0.8])
+
+    for replica, convolved in zip(goi.values, goi._convolve(goi.values)):
+        expected = signal.convolve2d(replica, goi.neighbourhood, mode='same', boundary='wrap')
+        assert convolved == pytest.approx(expected, abs=1e-9)
+
+
+def test_replica_observables_have_one_entry_per_replica():
+    goi = ReplicaGameOfIce(n_replicas=4, width=16, height=16, method='local')
+    goi.random(0.5)
+    goi.step()
+
+    for value in goi.observables().values():
+        assert np.shape(value) == (4,)
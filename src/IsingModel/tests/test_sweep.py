@@ -0,0 +1,53 @@
+import pytest
+
+import sweep
+
+SMALL = {'width': 16, 'height': 16, 'neighbourhood': [2], 'n_steps': 5}
+
+
+def test_load_config_ignores_unset_overrides():
+    config = sweep.load_config(overrides={'method': ['local'], 'n_steps': None})
+
+    assert config['method'] == ['local']
+    assert config['n_steps'] == sweep.DEFAULT_CONFIG['n_steps']
+
+
+def test_expand_nests_the_axes_in_order():
+    config = sweep.load_config(overrides=dict(SMALL, method=['global', 'local'], initial_temperature=[1, 2, 3]))
+    configurations = sweep.expand(config)
+
+    assert len(configurations) == 6
+    assert [(params['method'], params['initial_temperature']) for params in configurations[:3]] == \
+           [('global', 1), ('global', 2), ('global', 3)]
+    assert all(params['width'] == 16 for params in configurations)
+
+
+def test_run_code_identifies_the_configuration():
+    params = sweep.expand(sweep.load_config(overrides=dict(SMALL, method=['global', 'local'])))
+
+    assert sweep.run_code(params[0]) == 'Neigh2Prob0.50MethodglobalDistexp_decayBoundfillFill1'
+    assert sweep.run_code(params[1]) == 'Neigh2Prob0.50MethodlocalCoup1.0Temp100.0Distexp_decayBoundfillFill1'
+
+
+@pytest.mark.parametrize('method', ['global', 'local'])
+def test_run_configuration_runs_the_requested_steps(method):
+    params = sweep.expand(sweep.load_config(overrides=dict(SMALL, method=[method])))[0]
+
+    assert sweep.run_configuration(params)['time'] == 5
+
+
+def test_run_configuration_stops_once_converged():
+    convergence = {'window': 10, 'tolerance': 1.0, 'max_steps': 1000}
+    params = sweep.expand(sweep.load_config(overrides=dict(SMALL, convergence=convergence)))[0]
+
+    assert sweep.run_configuration(params)['time'] == 20
+
+
+def test_run_sweep_logs_every_configuration(tmp_path):
+    config = sweep.load_config(overrides=dict(SMALL, method=['global', 'local']))
+    output = tmp_path / 'sweep.log'
+    sweep.run_sweep(config, str(output), n_workers=1)
+    lines = output.read_text().splitlines()
+
+    assert lines[0] + '\n ' == sweep.LOG_FILE_HEADER
+    assert [line.split(',')[0] for line in lines[2:]] == [sweep.run_code(params) for params in sweep.expand(config)]